@@ -0,0 +1,6 @@
+# gunicorn configuration, loaded automatically from the working directory
+
+def post_worker_init(worker):
+    # Each worker keeps its own in-memory copy of the ISS data warm in the background
+    from iss_tracker import start_background_refresh
+    start_background_refresh()
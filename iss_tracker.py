@@ -1,31 +1,104 @@
 # !/usr/bin/env python3
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.exc import IntegrityError, OperationalError
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xmltodict
-from datetime import datetime, timedelta
+import orjson
+from lxml import etree
+import io
+from datetime import datetime, timedelta, timezone
 import numpy as np
+import numba
 import logging
 import math
+import re
+import os
+import threading
+import zlib
+import functools
 from geopy.geocoders import Nominatim
+from geopy.adapters import RequestsAdapter
+from apscheduler.schedulers.background import BackgroundScheduler
 
 # Configure logging
 logging.basicConfig(level='WARNING', format='%(asctime)s - %(levelname)s - %(message)s')
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes with orjson: compact, without key sorting, and able to serialize NumPy values.
+    """
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        # Hand orjson's bytes straight to the response instead of round-tripping through str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY), mimetype=self.mimetype)
+
 # Initialize Flask app and database
 app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///iss_data.db'
+app.json = OrjsonProvider(app)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///iss_data.db')
 db = SQLAlchemy(app)
 
 # Constants
 URL = "https://nasa-public-data.s3.amazonaws.com/iss-coords/current/ISS_OEM/ISS.OEM_J2K_EPH.xml"
 MEAN_EARTH_RADIUS = 6371  # Earth's radius in km
+REQUEST_TIMEOUT = (5, 30)  # (connect, read) timeouts in seconds
+CACHE_TTL = timedelta(hours=1)  # How long downloaded ISS data is considered current
+REFRESH_INTERVAL = timedelta(minutes=55)  # How often the background job refreshes the data, ahead of CACHE_TTL
+RETRY_INTERVAL = timedelta(minutes=1)  # How long stale data is served after a failed reload before trying again
+XML_COMPRESSION_LEVEL = 3  # zlib level for the cached XML; higher levels cost more CPU for little extra saving
+STATE_VECTOR_FIELDS = ('X', 'Y', 'Z', 'X_DOT', 'Y_DOT', 'Z_DOT')  # Position (km) and velocity (km/s) components
+# Shape of an epoch accepted in request paths: YYYY-MM-DDTHH:MM:SS with optional fraction and UTC offset
+EPOCH_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.(?P<fraction>\d+))?(?:Z|[+-]\d{2}:\d{2})?')
+GEOCODE_PRECISION = 1  # Decimal places coordinates are rounded to before reverse geocoding (~11 km cells)
+
+# Shared HTTP session so repeated downloads reuse the pooled keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.3)))
+
+# Shared geocoder so reverse geocoding reuses its pooled keep-alive connection to Nominatim
+GEOLOCATOR = Nominatim(user_agent="iss_tracker", timeout=5, adapter_factory=functools.partial(RequestsAdapter, pool_connections=2, pool_maxsize=8))
+
+# Process-local copy of the latest ISS data so requests skip the database round trip
+_CACHE = {'data': None, 'expires': datetime.min}
+_CACHE_LOCK = threading.Lock()
 
 class ISSData(db.Model):
+    # Named apart from the original `iss_data` table, whose JSON schema create_all cannot migrate
+    __tablename__ = 'iss_oem_cache'
     id = db.Column(db.Integer, primary_key=True)
-    data = db.Column(db.JSON, nullable=False)
+    # The downloaded XML, zlib compressed. Deferred so expiry checks and refreshes do not load the blob unless it is used.
+    xml = db.deferred(db.Column(db.LargeBinary, nullable=False))
+    # Indexed so finding the latest row is an index probe rather than a table scan
+    timestamp = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+    # Validators sent back to the server on refresh so unchanged data is not re-transferred
+    etag = db.Column(db.String)
+    last_modified = db.Column(db.String)
+
+class GeoCache(db.Model):
+    # Reverse geocoding results keyed by rounded coordinates, kept across restarts
+    lat = db.Column(db.Float, primary_key=True)
+    lon = db.Column(db.Float, primary_key=True)
+    address = db.Column(db.String, nullable=False)
     timestamp = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
+# Create the cache tables on import so they also exist when served by a WSGI server such as gunicorn
+with app.app_context():
+    try:
+        db.create_all()
+    except OperationalError as e:
+        # Several workers can start at once; only one of them needs to create the tables
+        logging.info(f"Database tables already created: {e}")
+
 def parse_date(date_str: str) -> datetime:
     """
     Parse the custom date format used in the ISS data.
@@ -36,91 +109,393 @@ def parse_date(date_str: str) -> datetime:
     Returns:
         datetime: Parsed datetime object.
     """
+    # Fast path for the fixed YYYY-DDDTHH:MM:SS.mmmZ layout NASA publishes: slice out the day of year
+    # and let the C ISO parser handle the rest on January 1st
+    if (len(date_str) == 22 and date_str.isascii() and date_str[4] == '-' and date_str[8] == 'T'
+            and date_str[11] == ':' and date_str[14] == ':' and date_str[17] == '.' and date_str[21] == 'Z'):
+        day = date_str[5:8]
+        if date_str[0:4].isdigit() and day.isdigit() and 1 <= int(day) <= 365:
+            return datetime.fromisoformat(date_str[0:4] + '-01-01T' + date_str[9:21]) + timedelta(days=int(day) - 1)
+
+    # Anything else, including day 366, goes through strptime, which also raises the ValueError for invalid dates
     return datetime.strptime(date_str, '%Y-%jT%H:%M:%S.%fZ')
 
-def download_and_parse_iss_data(URL: str) -> dict:
+def parse_dates(date_strs: list) -> np.ndarray:
     """
-    Download and parse the ISS data from the given URL into a dictionaries.
+    Parse many dates in the custom ISS data format at once.
+
+    Args:
+        date_strs (list of str): Date strings in the ISS data format.
+
+    Returns:
+        np.ndarray: Parsed datetime64[us] array.
+    """
+    # Check the fixed YYYY-DDDTHH:MM:SS.fZ layout like strptime would, so a malformed feed fails instead of shifting epochs
+    days = []
+    for date_str in date_strs:
+        day = date_str[5:8]
+        if (len(date_str) < 20 or date_str[4] != '-' or date_str[8] != 'T' or date_str[11] != ':' or date_str[14] != ':'
+                or date_str[17] != '.' or date_str[-1] != 'Z' or not (day.isascii() and day.isdigit()) or not 1 <= int(day) <= 366):
+            raise ValueError(f"time data {date_str!r} does not match format '%Y-%jT%H:%M:%S.%fZ'")
+        days.append(int(day))
+
+    # NumPy cannot parse day-of-year dates, so parse the time on January 1st and add the day offset
+    year_starts = np.array([f"{date_str[:4]}-01-01T{date_str[9:-1]}" for date_str in date_strs], dtype='datetime64[us]')
+    day_offsets = np.array(days, dtype=np.int64) - 1
+    return year_starts + day_offsets.astype('timedelta64[D]')
+
+def isoformat_dates(dates: np.ndarray) -> list:
+    """
+    Format datetime64 values the same way as `datetime.isoformat`.
+
+    Args:
+        dates (np.ndarray): Array of datetime64 values.
+
+    Returns:
+        list of str: ISO formatted dates, with microseconds only where they are non-zero.
+    """
+    has_microseconds = dates != dates.astype('datetime64[s]')
+    return np.where(has_microseconds, np.datetime_as_string(dates, unit='us'), np.datetime_as_string(dates, unit='s')).tolist()
+
+def download_iss_data(URL: str, etag: str = None, last_modified: str = None) -> requests.Response:
+    """
+    Download the raw ISS data from the given URL using the shared HTTP session.
 
     Args:
         URL (str): URL to download the ISS data from.
+        etag (str): ETag of the previously downloaded data, sent as `If-None-Match`.
+        last_modified (str): Last-Modified value of the previously downloaded data, sent as `If-Modified-Since`.
 
     Returns:
-        iss_data (dict): A dictionary containing ISS data including header, metadata, state vectors, and comments.
+        requests.Response: The HTTP response. Its status code is 304 (with an empty body) if the data is unchanged.
     """
+    headers = {'Accept-Encoding': 'gzip'}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+
     try:
-        # Downloading the data from the URL
-        response = requests.get(URL)
+        response = SESSION.get(URL, timeout=REQUEST_TIMEOUT, headers=headers)
         response.raise_for_status()
-        data = xmltodict.parse(response.content)
+        return response
+    except requests.RequestException as e:
+        logging.error(f"Error fetching data from URL: {e}")
+        raise
+
+def parse_iss_data(content: bytes) -> dict:
+    """
+    Parse the raw ISS XML data into a dictionary.
+
+    Args:
+        content (bytes): The ISS OEM XML document.
 
-        # Extracting the header and metadata
+    Returns:
+        iss_data (dict): A dictionary containing ISS data including header, metadata, state vectors, and comments.
+    """
+    try:
         iss_data = {
-            'header': data['ndm']['oem']['header'],
-            'metadata': data['ndm']['oem']['body']['segment']['metadata'],
+            'header': None,
+            'metadata': None,
             'state_vectors': [],
             'comments': []
         }
-
-        # Separating segment data
-        segment_data = data['ndm']['oem']['body']['segment']['data']
-
-        # Extracting comments
-        if 'COMMENT' in segment_data:
-            comments = [comment for comment in segment_data['COMMENT'] if comment is not None and isinstance(comment, str)]
-            iss_data['comments'] = comments
-        else:
+        has_comments = False
+
+        # Stream through the document, handling each element of interest as soon as it is complete
+        for _, element in etree.iterparse(io.BytesIO(content), tag=('header', 'metadata', 'COMMENT', 'stateVector')):
+            if element.tag == 'stateVector':
+                # Read every child in one pass; a findtext call per field rescans the children each time
+                fields = {child.tag: child.text for child in element}
+                iss_data['state_vectors'].append({
+                    # Timestamp, converted for all state vectors at once below
+                    'EPOCH': fields['EPOCH'],
+                    # Position vectors (in km)
+                    'X': float(fields['X']),
+                    'Y': float(fields['Y']),
+                    'Z': float(fields['Z']),
+                    # Velocity vectors (in km/s)
+                    'X_DOT': float(fields['X_DOT']),
+                    'Y_DOT': float(fields['Y_DOT']),
+                    'Z_DOT': float(fields['Z_DOT'])
+                })
+            elif element.tag == 'COMMENT':
+                # Comments inside the header or metadata are kept as part of those sections
+                if element.getparent().tag != 'data':
+                    continue
+                has_comments = True
+                if element.text is not None:
+                    iss_data['comments'].append(element.text)
+            else:
+                # The header and metadata are small, so convert them with xmltodict to keep their dictionary layout.
+                # Serializing a subtree repeats the document's namespace declarations, which are dropped here.
+                section = xmltodict.parse(etree.tostring(element, with_tail=False))[element.tag]
+                iss_data[element.tag] = {key: value for key, value in section.items() if not key.startswith('@xmlns')}
+
+            # Free the processed element and its already handled siblings
+            element.clear(keep_tail=False)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+        if iss_data['header'] is None or iss_data['metadata'] is None:
+            raise ValueError("ISS data is missing its header or metadata")
+
+        # Parsing every epoch in one batch is much faster than calling parse_date per state vector
+        epochs = isoformat_dates(parse_dates([vector['EPOCH'] for vector in iss_data['state_vectors']]))
+        for vector, epoch in zip(iss_data['state_vectors'], epochs):
+            vector['EPOCH'] = epoch
+        if not has_comments:
             logging.warning("No 'COMMENT' key found in segment_data")
-
-        # Extracting data from each stateVector
-        for state_vector in segment_data['stateVector']:
-            iss_data['state_vectors'].append({
-                # Timestamp
-                'EPOCH': parse_date(state_vector['EPOCH']).isoformat(),
-                # Position vectors (in km)
-                'X': float(state_vector['X']['#text']),
-                'Y': float(state_vector['Y']['#text']),
-                'Z': float(state_vector['Z']['#text']),
-                # Velocity vectors (in km/s)
-                'X_DOT': float(state_vector['X_DOT']['#text']),
-                'Y_DOT': float(state_vector['Y_DOT']['#text']),
-                'Z_DOT': float(state_vector['Z_DOT']['#text'])
-            })
         return iss_data
 
-    except requests.RequestException as e:
-        logging.error(f"Error fetching data from URL: {e}")
-        raise
     except Exception as e:
         logging.error(f"Error parsing data: {e}")
         raise
+
+def download_and_parse_iss_data(URL: str) -> dict:
+    """
+    Download and parse the ISS data from the given URL into a dictionaries.
+
+    Args:
+        URL (str): URL to download the ISS data from.
+
+    Returns:
+        iss_data (dict): A dictionary containing ISS data including header, metadata, state vectors, and comments.
+    """
+    response = download_iss_data(URL)
+    return parse_iss_data(response.content)
     
-def fetch_iss_data() -> dict:
+def load_latest_iss_data(max_age: timedelta = CACHE_TTL) -> tuple:
     """
-    Fetch the latest ISS data, either from the cache or by downloading it.
+    Load the latest ISS data from the database, downloading new data if the cached row has expired.
 
     Args:
-        None
+        max_age (timedelta): Age after which the cached row is refreshed from the server.
 
     Returns:
-        dict: The ISS data.
+        tuple: A tuple of (ISSData row holding the current data, parsed ISS data dictionary).
     """
-    one_hour_ago = datetime.utcnow() - timedelta(hours=1)
-    cached_data = ISSData.query.filter(ISSData.timestamp > one_hour_ago).first()
+    expiry_cutoff = datetime.utcnow() - max_age
+    latest_data = ISSData.query.order_by(ISSData.timestamp.desc()).first()
     
     # Debugging: Force fetching new data
-    #cached_data = False
+    #latest_data = None
 
-    if cached_data:
+    if latest_data and latest_data.timestamp > expiry_cutoff:
         logging.info("Using cached ISS data")
-        return cached_data.data
+        return latest_data, parse_iss_data(zlib.decompress(latest_data.xml))
+
+    logging.info("Fetching new ISS data")
+    if latest_data:
+        response = download_iss_data(URL, latest_data.etag, latest_data.last_modified)
     else:
-        logging.info("Fetching new ISS data")
-        iss_data = download_and_parse_iss_data(URL)
-        new_data = ISSData(data=iss_data)
-        db.session.add(new_data)
+        response = download_iss_data(URL)
+
+    # The server reports the data is unchanged, so the cached copy is still current
+    if response.status_code == 304 and latest_data:
+        logging.info("ISS data not modified, refreshing cache timestamp")
+        latest_data.timestamp = datetime.utcnow()
         db.session.commit()
-        return iss_data
+        return latest_data, parse_iss_data(zlib.decompress(latest_data.xml))
+
+    # Parse before storing so a malformed download is never cached
+    iss_data = parse_iss_data(response.content)
+    new_data = ISSData(
+        xml=zlib.compress(response.content, XML_COMPRESSION_LEVEL),
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified')
+    )
+    db.session.add(new_data)
+    db.session.commit()
+    return new_data, iss_data
+
+def build_state_vector_arrays(state_vectors: list) -> dict:
+    """
+    Convert the list of state vectors into a struct-of-arrays layout for vectorized lookups and calculations.
+
+    Args:
+        state_vectors (list of dict): List of state vectors from the ISS data.
+
+    Returns:
+        dict: NumPy arrays keyed by field name. 'EPOCH' is a datetime64[us] array and the position/velocity fields are float64 arrays.
+    """
+    arrays = {'EPOCH': np.array([vector['EPOCH'] for vector in state_vectors], dtype='datetime64[us]')}
+    for key in STATE_VECTOR_FIELDS:
+        arrays[key] = np.fromiter((vector[key] for vector in state_vectors), dtype=np.float64, count=len(state_vectors))
+    return arrays
+
+def build_epochs_serializer(state_vectors: list):
+    """
+    Build a memoized JSON serializer for pages of the state vectors.
+
+    Args:
+        state_vectors (list of dict): List of state vectors from the ISS data.
+
+    Returns:
+        function: Takes `offset` and `limit` and returns the JSON encoded page as bytes. A `limit` of `None` returns every state vector.
+    """
+    # Encode each state vector once, so any page is just a join of already encoded chunks
+    chunks = [orjson.dumps(vector) for vector in state_vectors]
+
+    # Only the full data set is kept encoded: it is the default page, and caching pages keyed on
+    # client chosen offsets and limits would let each of them hold a near full copy of the data
+    @functools.lru_cache(maxsize=1)
+    def serialize_all() -> bytes:
+        return b'[' + b','.join(chunks) + b']'
+
+    def serialize_epochs(offset: int, limit: int) -> bytes:
+        end = len(chunks) if limit is None else min(offset + limit, len(chunks))
+        if limit is None or (offset == 0 and end == len(chunks)):
+            return serialize_all()
+        return b'[' + b','.join(chunks[offset:end]) + b']'
+
+    return serialize_epochs
+
+def prepare_iss_data(iss_data: dict) -> dict:
+    """
+    Attach the derived lookup structures used by the routes to a copy of the ISS data.
+
+    Args:
+        iss_data (dict): The parsed ISS data.
+
+    Returns:
+        dict: A shallow copy of `iss_data` with the epoch array and the precomputed speed, latitude,
+              longitude, and altitude arrays added under the '_arrays' key,
+              a mapping of epoch datetimes to state vector indices under the '_epoch_index' key, a
+              memoized `/epochs` page serializer under the '_serialize_epochs' key, and the encoded
+              comments, header, and metadata under the '_comment_json', '_header_json', and '_metadata_json' keys.
+    """
+    prepared = dict(iss_data)
+    # Precompute the derived quantities for every epoch in one vectorized pass from the full precision values,
+    # so they agree with the coordinates served from the state vector dicts
+    arrays = build_state_vector_arrays(iss_data['state_vectors'])
+    arrays['SPEED'] = calculate_speed_batch(np.column_stack([arrays[key] for key in ('X_DOT', 'Y_DOT', 'Z_DOT')]))
+    arrays['LATITUDE'], arrays['LONGITUDE'], arrays['ALTITUDE'] = calculate_locations(arrays)
+    # Responses serialize the state vector dicts, so the position/velocity columns are not kept
+    for key in STATE_VECTOR_FIELDS:
+        del arrays[key]
+    prepared['_arrays'] = arrays
+    prepared['_epoch_index'] = {epoch: i for i, epoch in enumerate(prepared['_arrays']['EPOCH'].tolist())}
+    prepared['_serialize_epochs'] = build_epochs_serializer(iss_data['state_vectors'])
+    # These sections never change for a given data set, so encode them once
+    prepared['_comment_json'] = orjson.dumps(iss_data['comments'])
+    prepared['_header_json'] = orjson.dumps(iss_data['header'])
+    prepared['_metadata_json'] = orjson.dumps(iss_data['metadata'])
+    return prepared
+
+def reload_iss_cache(max_age: timedelta = CACHE_TTL) -> dict:
+    """
+    Load the latest ISS data into the in-memory cache. Must be called with the app context and `_CACHE_LOCK` held.
+
+    Args:
+        max_age (timedelta): Age after which the cached database row is refreshed from the server.
+
+    Returns:
+        dict: The ISS data now in the in-memory cache.
+    """
+    latest_data, iss_data = load_latest_iss_data(max_age)
+    _CACHE['data'] = prepare_iss_data(iss_data)
+    _CACHE['expires'] = latest_data.timestamp + CACHE_TTL
+    return _CACHE['data']
+
+def fetch_iss_data() -> dict:
+    """
+    Fetch the latest ISS data, either from the in-memory cache, the database, or by downloading it.
+
+    Args:
+        None
+
+    Returns:
+        dict: The ISS data.
+    """
+    # Normally kept warm by the background refresh, so requests only read the cache
+    if datetime.utcnow() < _CACHE['expires']:
+        return _CACHE['data']
+
+    # Only one request reloads the data. Without data the others wait and reuse its result;
+    # with stale data they keep serving it rather than queueing behind a slow download.
+    if not _CACHE_LOCK.acquire(blocking=_CACHE['data'] is None):
+        return _CACHE['data']
+    try:
+        if datetime.utcnow() < _CACHE['expires']:
+            return _CACHE['data']
+        try:
+            return reload_iss_cache()
+        except Exception as e:
+            if _CACHE['data'] is None:
+                raise
+            # Keep serving the last good data and back off before the next attempt
+            logging.error(f"Error reloading ISS data, serving stale data: {e}")
+            _CACHE['expires'] = datetime.utcnow() + RETRY_INTERVAL
+            return _CACHE['data']
+    finally:
+        _CACHE_LOCK.release()
+
+def refresh_iss_cache() -> None:
+    """
+    Refresh the in-memory ISS data before it expires. Runs as the background scheduler's job.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    try:
+        with app.app_context(), _CACHE_LOCK:
+            # Only reuse a database row young enough to stay valid until the next refresh
+            reload_iss_cache(CACHE_TTL - REFRESH_INTERVAL)
+    except Exception as e:
+        # Requests fall back to reloading the data themselves once the cache expires
+        logging.error(f"Error refreshing ISS data: {e}")
+
+def start_background_refresh() -> BackgroundScheduler:
+    """
+    Start a scheduler that loads the ISS data right away and keeps refreshing it, so requests never wait on a download.
+
+    Args:
+        None
+
+    Returns:
+        BackgroundScheduler: The running scheduler.
+    """
+    scheduler = BackgroundScheduler(daemon=True)
+    # The first run happens immediately but off the caller's thread, so a slow download cannot stall server startup
+    scheduler.add_job(refresh_iss_cache, 'interval', seconds=REFRESH_INTERVAL.total_seconds(), id='refresh_iss_cache', next_run_time=datetime.now())
+    scheduler.start()
+    return scheduler
+
+def parse_epoch(epoch: str) -> datetime:
+    """
+    Parse an epoch given in a request path, raising a ValueError with a usage hint if it is not in ISO format.
+
+    Args:
+        epoch (str): Date string in ISO format, e.g. YYYY-MM-DDTHH:MM:SS.
+
+    Returns:
+        datetime: Parsed naive UTC datetime object.
+    """
+    error_message = "Invalid date format. Please use the ISO format: YYYY-MM-DDTHH:MM:SS"
+
+    # Reject malformed strings up front; fromisoformat still checks that the date itself is valid
+    match = EPOCH_PATTERN.fullmatch(epoch)
+    if not match:
+        raise ValueError(error_message)
+    # Newer Pythons' fromisoformat silently truncates fractions finer than a microsecond
+    if match['fraction'] and len(match['fraction']) > 6:
+        raise ValueError(error_message)
+    # Older Pythons' fromisoformat does not accept the Z suffix the pattern allows
+    if epoch.endswith('Z'):
+        epoch = epoch[:-1] + '+00:00'
+    try:
+        epoch_date = datetime.fromisoformat(epoch)
+    except ValueError:
+        raise ValueError(error_message)
+
+    # The ISS data uses naive UTC datetimes
+    if epoch_date.tzinfo is not None:
+        epoch_date = epoch_date.astimezone(timezone.utc).replace(tzinfo=None)
+    return epoch_date
 
 def calculate_speed(x_dot: float, y_dot: float, z_dot: float) -> float:
     """
@@ -134,37 +509,89 @@ def calculate_speed(x_dot: float, y_dot: float, z_dot: float) -> float:
     Returns:
         float: The speed of the ISS in km/s.
     """
-    return np.sqrt(x_dot**2 + y_dot**2 + z_dot**2)
+    # math.sqrt avoids NumPy's dispatch overhead for a single value
+    return math.sqrt(x_dot*x_dot + y_dot*y_dot + z_dot*z_dot)
+
+def calculate_speed_batch(velocities: np.ndarray) -> np.ndarray:
+    """
+    Calculate the speed of the ISS for many velocity vectors at once.
+
+    Args:
+        velocities (np.ndarray): (N, 3) array of the X, Y, and Z velocity components in km/s.
+
+    Returns:
+        np.ndarray: The N speeds of the ISS in km/s.
+    """
+    return np.sqrt(np.einsum('ij,ij->i', velocities, velocities))
+
+def find_epoch_index_by_date(iss_data: dict, epoch_date: datetime) -> int:
+    """
+    Find the index of the state vector for a specific date within the data set.
+
+    Args:
+        iss_data (dict): The ISS data, as returned by `fetch_iss_data`.
+        epoch_date (datetime): The specific date and time to find in the ISS data set.
+
+    Returns:
+        int: Index into the ISS data's state vectors and arrays of the given `epoch_date`. Returns `None` if not found.
+    """
+    # The index is keyed by naive UTC datetimes, so compare aware dates in UTC
+    if epoch_date.tzinfo is not None:
+        epoch_date = epoch_date.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return iss_data['_epoch_index'].get(epoch_date)
 
-def find_epoch_by_date(state_vectors: list, epoch_date: datetime) -> dict:
+def find_epoch_by_date(iss_data: dict, epoch_date: datetime) -> dict:
     """
     Searches for and return the epoch data for a specific date within the data set.
 
     Args:
-        state_vectors (list of dict): List of state vectors from the ISS data.
+        iss_data (dict): The ISS data, as returned by `fetch_iss_data`.
         epoch_date (datetime): The specific date and time to find in the ISS data set.
 
     Returns:
         dict: The state vector that matches the given `epoch_date`. Returns `None` if not found.
     """
-    for vector in state_vectors:
-        if vector['EPOCH'] == epoch_date:
-            return vector
+    index = find_epoch_index_by_date(iss_data, epoch_date)
+    if index is not None:
+        return iss_data['state_vectors'][index]
     return None
 
-def calculate_location(epoch_data: dict) -> tuple:
+def find_closest_epoch_index(iss_data: dict, date: datetime) -> int:
+    """
+    Find the index of the state vector whose epoch is closest to the given date.
+
+    Args:
+        iss_data (dict): The ISS data, as returned by `fetch_iss_data`.
+        date (datetime): The naive UTC date and time to compare against.
+
+    Returns:
+        int: Index into the ISS data's state vectors of the closest epoch.
+    """
+    # The OEM lists its epochs in ascending order, so a binary search finds the neighbours of the date
+    epochs = iss_data['_arrays']['EPOCH']
+    target = np.datetime64(date, 'us')
+    index = int(np.searchsorted(epochs, target))
+    if index == 0:
+        return 0
+    if index == len(epochs):
+        return index - 1
+    # Ties go to the earlier epoch
+    return index - 1 if target - epochs[index - 1] <= epochs[index] - target else index
+
+def calculate_location(epoch_data: dict, epoch_time: datetime) -> tuple:
     """
     Calculate the latitude, longitude, and altitude of an object in Earth orbit from its Cartesian coordinates.
 
     Args:
         epoch_data (dict): Dictionary containing 'X', 'Y', and 'Z' keys with the object's coordinates.
+        epoch_time (datetime): The already parsed epoch of `epoch_data`, in UTC.
 
     Returns:
         tuple: A tuple of (latitude, longitude, altitude).
     """
     x, y, z = epoch_data['X'], epoch_data['Y'], epoch_data['Z']
     
-    epoch_time = datetime.fromisoformat(epoch_data['EPOCH'])
     hrs = epoch_time.hour
     mins = epoch_time.minute
     logging.debug(f"Epoch time: {epoch_time}, Hrs: {hrs}, Mins: {mins}")
@@ -174,9 +601,82 @@ def calculate_location(epoch_data: dict) -> tuple:
 
     lon = (lon + 180) % 360 - 180
 
-    alt = np.sqrt(x**2 + y**2 + z**2) - MEAN_EARTH_RADIUS
+    alt = math.sqrt(x**2 + y**2 + z**2) - MEAN_EARTH_RADIUS
+    return lat, lon, alt
+
+def calculate_locations(arrays: dict) -> tuple:
+    """
+    Calculate the latitude, longitude, and altitude for every state vector at once.
+
+    Args:
+        arrays (dict): State vector arrays, as returned by `build_state_vector_arrays`.
+
+    Returns:
+        tuple: A tuple of (latitude, longitude, altitude) NumPy arrays.
+    """
+    x, y, z = arrays['X'], arrays['Y'], arrays['Z']
+
+    # Hour and minute of each epoch, matching `calculate_location`
+    epochs = arrays['EPOCH']
+    minute_of_day = (epochs - epochs.astype('datetime64[D]')).astype('timedelta64[m]').astype(np.int64)
+    hrs = minute_of_day // 60
+    mins = minute_of_day % 60
+
+    return _locate_bulk(x, y, z, hrs, mins)
+
+@numba.njit(cache=True, fastmath=True)
+def _locate_bulk(x: np.ndarray, y: np.ndarray, z: np.ndarray, hrs: np.ndarray, mins: np.ndarray) -> tuple:
+    """
+    Compiled kernel applying the `calculate_location` formulas to whole arrays of coordinates.
+
+    Args:
+        x (np.ndarray): X coordinates in km.
+        y (np.ndarray): Y coordinates in km.
+        z (np.ndarray): Z coordinates in km.
+        hrs (np.ndarray): Hour of each epoch.
+        mins (np.ndarray): Minute of each epoch.
+
+    Returns:
+        tuple: A tuple of (latitude, longitude, altitude) NumPy arrays.
+    """
+    n = x.shape[0]
+    lat = np.empty(n)
+    lon = np.empty(n)
+    alt = np.empty(n)
+    for i in range(n):
+        lat[i] = np.degrees(np.arctan2(z[i], np.sqrt(x[i]**2 + y[i]**2)))
+        lon_i = np.degrees(np.arctan2(y[i], x[i])) - ((hrs[i]-12)+(mins[i]/60))*(360/24) + 19
+        lon[i] = (lon_i + 180) % 360 - 180
+        alt[i] = np.sqrt(x[i]**2 + y[i]**2 + z[i]**2) - MEAN_EARTH_RADIUS
     return lat, lon, alt
 
+@functools.lru_cache(maxsize=4096)
+def _geoposition_cached(lat: float, lon: float) -> str:
+    """
+    Reverse geocode rounded coordinates, remembering the result in memory and in the database for repeated lookups.
+
+    Args:
+        lat (float): Rounded latitude of the location.
+        lon (float): Rounded longitude of the location.
+
+    Returns:
+        str: The address of the location if available; otherwise, returns 'No location data'.
+    """
+    cached_address = db.session.get(GeoCache, (lat, lon))
+    if cached_address:
+        return cached_address.address
+
+    location = GEOLOCATOR.reverse((lat, lon), language='en')
+    address = "No location data" if location is None else location.address
+
+    try:
+        db.session.merge(GeoCache(lat=lat, lon=lon, address=address))
+        db.session.commit()
+    except IntegrityError:
+        # Another worker stored the same coordinates first
+        db.session.rollback()
+    return address
+
 def get_geoposition(lat: float, lon: float) -> str:
     """
     Retrieve the geolocation information for given latitude and longitude coordinates.
@@ -189,13 +689,8 @@ def get_geoposition(lat: float, lon: float) -> str:
         str: The address of the location if available; otherwise, returns 'No location data'.
     """
     try:
-        geolocator = Nominatim(user_agent="iss_tracker")
-        location = geolocator.reverse(f"{lat}, {lon}")
-        
-        if location is None:
-            return "No location data"
-        else:
-            return location.address
+        # Nearby coordinates share a cache entry, so repeated epochs skip the Nominatim round trip
+        return _geoposition_cached(round(lat, GEOCODE_PRECISION), round(lon, GEOCODE_PRECISION))
     except Exception as e:
         logging.error(f"Error in get_geoposition: {e}")
         raise Exception("Error retrieving address")
@@ -205,8 +700,7 @@ def get_geoposition(lat: float, lon: float) -> str:
 def get_comment():
     try:
         iss_data = fetch_iss_data()
-        comments = iss_data['comments']
-        return jsonify(comments)
+        return Response(iss_data['_comment_json'], mimetype='application/json')
     except KeyError:
         logging.error(f"Error accessing comments: {e}")
         return jsonify([])
@@ -218,8 +712,7 @@ def get_comment():
 def get_header():
     try:
         iss_data = fetch_iss_data()
-        header = iss_data['header']
-        return jsonify(header)
+        return Response(iss_data['_header_json'], mimetype='application/json')
     except KeyError as e:
         logging.error(f"Error accessing header data: {e}")
         return jsonify({}), 404
@@ -231,8 +724,7 @@ def get_header():
 def get_metadata():
     try:
         iss_data = fetch_iss_data()
-        metadata = iss_data['metadata']
-        return jsonify(metadata)
+        return Response(iss_data['_metadata_json'], mimetype='application/json')
     except KeyError as e:
         logging.error(f"Error accessing metadata: {e}")
         return jsonify({}), 404
@@ -243,35 +735,15 @@ def get_metadata():
 @app.route('/epochs', methods=['GET'])
 def get_epochs_data():
     try:
-        def parse_int(param_name, default=None, allow_negative=False, must_be_positive=False):
-            param_value = request.args.get(param_name, default=default, type=str)
-            logging.debug(f"{param_name}: {param_value}")
-            if param_value is None:
-                return default
-            else:
-                try:
-                    logging.debug(f"{param_name}: {param_value}")
-                    # Check for floating point numbers
-                    if '.' in param_value:
-                        raise ValueError(f"{param_name} must be an integer")
-                    # Check for non-numeric strings and convert to int
-                    try:
-                        param_value = int(param_value)
-                    except ValueError:
-                        raise ValueError(f"{param_name} must be a number")
-                    # Check for negative and positive numbers
-                    if not allow_negative and param_value < 0:
-                        raise ValueError(f"{param_name} must be non-negative")
-                    if must_be_positive and param_value <= 0:
-                        raise ValueError(f"{param_name} must be positive")
-                except ValueError as e:
-                    raise ValueError(f"Invalid value for {param_name}: {param_value}", f"{e}")
-                
-                return param_value
-
-        # Parse limit and offset with error handling
-        limit = parse_int('limit', default=None, must_be_positive=True)
-        offset = parse_int('offset', default='0', allow_negative=False)
+        # Parse limit and offset; Flask's type conversion returns None for values that are not integers
+        limit = request.args.get('limit', type=int)
+        offset = request.args.get('offset', type=int)
+        if 'limit' in request.args and (limit is None or limit <= 0):
+            raise ValueError(f"Invalid value for limit: {request.args['limit']}", "limit must be a positive integer")
+        if 'offset' in request.args and (offset is None or offset < 0):
+            raise ValueError(f"Invalid value for offset: {request.args['offset']}", "offset must be a non-negative integer")
+        if offset is None:
+            offset = 0
         
         # Debugging
         #logging.debug(f"Limit: {limit}, Offset: {offset}")
@@ -281,15 +753,12 @@ def get_epochs_data():
         if iss_data is None:
             raise Exception("No data available")
 
-        dataset = iss_data['state_vectors']
-
-        if offset >= len(dataset):
+        if offset >= len(iss_data['state_vectors']):
             raise ValueError("Offset exceeds the size of the dataset")
 
-        # Modify returned data based on limit and offset
-        if limit is not None:
-            dataset = dataset[offset:offset + limit]
-        return jsonify(dataset)
+        # Serve the page from the data set's already encoded state vectors
+        body = iss_data['_serialize_epochs'](offset, limit)
+        return Response(body, mimetype='application/json')
     
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -301,14 +770,11 @@ def get_epochs_data():
 def get_specific_epoch_data(epoch):
     try:
         # Check if the date is in the correct format
-        try:
-            epoch_date = datetime.fromisoformat(epoch)
-        except ValueError:
-            raise ValueError("Invalid date format. Please use the ISO format: YYYY-MM-DDTHH:MM:SS")
+        epoch_date = parse_epoch(epoch)
 
         iss_data = fetch_iss_data()
 
-        epoch_data = find_epoch_by_date(iss_data['state_vectors'], epoch)
+        epoch_data = find_epoch_by_date(iss_data, epoch_date)
         if epoch_data:
             return jsonify(epoch_data)
         else:
@@ -324,16 +790,14 @@ def get_specific_epoch_data(epoch):
 def get_specific_epoch_speed(epoch):
     try:
         # Check if the date is in the correct format
-        try:
-            epoch_date = datetime.fromisoformat(epoch)
-        except ValueError:
-            raise ValueError("Invalid date format. Please use the ISO format: YYYY-MM-DDTHH:MM:SS")
+        epoch_date = parse_epoch(epoch)
 
         iss_data = fetch_iss_data()
 
-        epoch_data = find_epoch_by_date(iss_data['state_vectors'], epoch)
-        if epoch_data:
-            speed = calculate_speed(epoch_data['X_DOT'], epoch_data['Y_DOT'], epoch_data['Z_DOT'])
+        epoch_index = find_epoch_index_by_date(iss_data, epoch_date)
+        if epoch_index is not None:
+            # Speed was precomputed for every epoch when the data was loaded
+            speed = float(iss_data['_arrays']['SPEED'][epoch_index])
             return jsonify({"SPEED": speed})
             
         else:
@@ -349,16 +813,17 @@ def get_specific_epoch_speed(epoch):
 def get_specific_epoch_location(epoch):
     try:
         # Check if the date is in the correct format
-        try:
-            epoch_date = datetime.fromisoformat(epoch)
-        except ValueError:
-            raise ValueError("Invalid date format. Please use the ISO format: YYYY-MM-DDTHH:MM:SS")
+        epoch_date = parse_epoch(epoch)
 
         iss_data = fetch_iss_data()
 
-        epoch_data = find_epoch_by_date(iss_data['state_vectors'], epoch)
-        if epoch_data:
-            lat, lon, alt = calculate_location(epoch_data)
+        epoch_index = find_epoch_index_by_date(iss_data, epoch_date)
+        if epoch_index is not None:
+            # Location was precomputed for every epoch when the data was loaded
+            arrays = iss_data['_arrays']
+            lat = float(arrays['LATITUDE'][epoch_index])
+            lon = float(arrays['LONGITUDE'][epoch_index])
+            alt = float(arrays['ALTITUDE'][epoch_index])
             geoposition = get_geoposition(lat, lon)
 
             location_data = {
@@ -382,9 +847,10 @@ def get_current_epoch_data():
     try:
         iss_data = fetch_iss_data()
         state_vectors = iss_data['state_vectors']
+        arrays = iss_data['_arrays']
 
-        now = datetime.utcnow()
-        closest_epoch = min(state_vectors, key=lambda x: abs(datetime.fromisoformat(x['EPOCH']) - now))
+        closest_index = find_closest_epoch_index(iss_data, datetime.utcnow())
+        closest_epoch = state_vectors[closest_index]
 
         epoch_data = {
             'EPOCH': closest_epoch['EPOCH'],
@@ -396,13 +862,14 @@ def get_current_epoch_data():
             'Z_DOT': closest_epoch['Z_DOT']
         }
 
-        speed = calculate_speed(epoch_data['X_DOT'], epoch_data['Y_DOT'], epoch_data['Z_DOT'])
-        epoch_data['SPEED'] = speed
-        lat, lon, alt = calculate_location(epoch_data)
+        # Speed and location were precomputed for every epoch when the data was loaded
+        epoch_data['SPEED'] = float(arrays['SPEED'][closest_index])
+        lat = float(arrays['LATITUDE'][closest_index])
+        lon = float(arrays['LONGITUDE'][closest_index])
         geoposition = get_geoposition(lat, lon)
         epoch_data['LATITUDE'] = lat
         epoch_data['LONGITUDE'] = lon
-        epoch_data['ALTITUDE'] = alt
+        epoch_data['ALTITUDE'] = float(arrays['ALTITUDE'][closest_index])
         epoch_data['GEOPOSITION'] = geoposition
 
         return jsonify(epoch_data)
@@ -412,6 +879,10 @@ def get_current_epoch_data():
         return jsonify({"error": str(e)}), 500
 
 if __name__ == "__main__":
-    with app.app_context():
-        db.create_all()
-    app.run(debug=True)
\ No newline at end of file
+    # Werkzeug development server; production deployments run under gunicorn (see README)
+    debug = bool(os.environ.get('DEV'))
+    # With the reloader the module runs again in a child process that serves the requests,
+    # so only that process refreshes the data
+    if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_background_refresh()
+    app.run(debug=debug)
\ No newline at end of file
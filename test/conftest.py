@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+import os
+import math
+from datetime import datetime, timedelta
+import pytest
+import responses
+
+# Keep the tests' data and geocoding cache in memory instead of the app's database file
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+import iss_tracker
+from iss_tracker import URL, fetch_iss_data, _geoposition_cached, app
+
+OFFLINE_ADDRESS = "Offline test address"
+
+def build_oem_xml(state_vectors: list) -> bytes:
+    """
+    Builds a minimal ISS OEM XML document around the given state vectors.
+
+    Args:
+        state_vectors (list): State vectors with ISO formatted epochs.
+
+    Returns:
+        bytes: The OEM XML document.
+    """
+    vectors = ''.join(
+        f"<stateVector><EPOCH>{datetime.fromisoformat(vector['EPOCH'].rstrip('Z')).strftime('%Y-%jT%H:%M:%S.000Z')}</EPOCH>"
+        + ''.join(f'<{key} units="km">{vector[key]}</{key}>' for key in ['X', 'Y', 'Z'])
+        + ''.join(f'<{key} units="km/s">{vector[key]}</{key}>' for key in ['X_DOT', 'Y_DOT', 'Z_DOT'])
+        + "</stateVector>"
+        for vector in state_vectors
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<ndm><oem id="CCSDS_OEM_VERS" version="2.0">'
+        '<header><CREATION_DATE>2024-053T12:00:00.000Z</CREATION_DATE><ORIGINATOR>JSC</ORIGINATOR></header>'
+        '<body><segment>'
+        '<metadata><OBJECT_NAME>ISS</OBJECT_NAME><OBJECT_ID>1998-067-A</OBJECT_ID><CENTER_NAME>EARTH</CENTER_NAME>'
+        '<REF_FRAME>EME2000</REF_FRAME><TIME_SYSTEM>UTC</TIME_SYSTEM></metadata>'
+        f'<data><COMMENT>Test comment</COMMENT>{vectors}</data>'
+        '</segment></body></oem></ndm>'
+    ).encode()
+
+def build_orbit_state_vectors(start: datetime, count: int) -> list:
+    """
+    Builds state vectors every 4 minutes along a circular ISS-like orbit.
+
+    Args:
+        start (datetime): Epoch of the first state vector.
+        count (int): Number of state vectors.
+
+    Returns:
+        list: State vectors with ISO formatted epochs.
+    """
+    radius, period, inclination = 6778.0, 92.7 * 60, math.radians(51.6)
+    speed = 2 * math.pi * radius / period
+    state_vectors = []
+    for i in range(count):
+        angle = 2 * math.pi * (240 * i) / period
+        state_vectors.append({
+            'EPOCH': (start + timedelta(minutes=4 * i)).isoformat(),
+            'X': radius * math.cos(angle),
+            'Y': radius * math.sin(angle) * math.cos(inclination),
+            'Z': radius * math.sin(angle) * math.sin(inclination),
+            'X_DOT': -speed * math.sin(angle),
+            'Y_DOT': speed * math.cos(angle) * math.cos(inclination),
+            'Z_DOT': speed * math.cos(angle) * math.sin(inclination)
+        })
+    return state_vectors
+
+@pytest.fixture(scope="session", autouse=True)
+def offline_services():
+    """
+    Serves a synthetic OEM document for the NASA URL and stubs the geocoder, so the default test run needs no network.
+
+    Args:
+        None
+
+    Returns:
+        dict: Functions to 'stop' and 'start' the stubs around tests that talk to the live services.
+    """
+    # Half a day of state vectors either side of now, so /now finds a nearby epoch
+    start = datetime.utcnow().replace(second=0, microsecond=0) - timedelta(hours=12)
+    mock = responses.RequestsMock(assert_all_requests_are_fired=False)
+    mock.add(responses.GET, URL, body=build_oem_xml(build_orbit_state_vectors(start, 361)), status=200)
+    monkeypatch = pytest.MonkeyPatch()
+
+    def start_stubs():
+        mock.start()
+        monkeypatch.setattr(iss_tracker.GEOLOCATOR, 'reverse', lambda coordinates, language=None: type('Location', (), {'address': OFFLINE_ADDRESS})())
+        _geoposition_cached.cache_clear()
+
+    def stop_stubs():
+        mock.stop()
+        monkeypatch.undo()
+        _geoposition_cached.cache_clear()
+
+    start_stubs()
+    yield {'start': start_stubs, 'stop': stop_stubs}
+    stop_stubs()
+
+@pytest.fixture(autouse=True)
+def live_services(request, offline_services):
+    """
+    Lifts the offline stubs for tests marked `integration`, which check the live NASA and Nominatim services.
+
+    Args:
+        request (FixtureRequest): The requesting test.
+        offline_services (dict): Controls for the session's offline stubs.
+
+    Returns:
+        None
+    """
+    if request.node.get_closest_marker('integration') is None:
+        yield
+        return
+    offline_services['stop']()
+    try:
+        yield
+    finally:
+        offline_services['start']()
+
+@pytest.fixture(scope="session")
+def iss_data():
+    """
+    Loads the ISS data once for the whole test session through the app's cache.
+
+    Args:
+        None
+
+    Returns:
+        dict: The prepared ISS data shared by every test that needs real state vectors.
+    """
+    with app.app_context():
+        return fetch_iss_data()
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Provides a Flask test client shared by all route tests.
+
+    Args:
+        None
+
+    Returns:
+        FlaskClient: Flask test client for the app.
+    """
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+@pytest.fixture(scope="session")
+def first_vector(iss_data):
+    """
+    Provides the first state vector of the session-wide ISS data.
+
+    Args:
+        iss_data (dict): Session-wide ISS data.
+
+    Returns:
+        dict: The first state vector.
+    """
+    return iss_data['state_vectors'][0]
+
+@pytest.fixture(scope="session")
+def valid_epoch(first_vector):
+    """
+    Provides an epoch string that is known to exist in the ISS data.
+
+    Args:
+        first_vector (dict): The first state vector.
+
+    Returns:
+        str: The EPOCH of the first state vector.
+    """
+    return first_vector['EPOCH']
@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 import pytest
-from datetime import datetime, timedelta
-from iss_tracker import download_and_parse_iss_data, parse_date, calculate_speed, find_epoch_by_date, fetch_iss_data, calculate_location, get_geoposition, app
+import random
+from datetime import datetime, timedelta, timezone
+from iss_tracker import EPOCH_PATTERN, download_and_parse_iss_data, parse_iss_data, parse_date, parse_dates, isoformat_dates, parse_epoch, calculate_speed, calculate_speed_batch, find_epoch_index_by_date, find_epoch_by_date, find_closest_epoch_index, fetch_iss_data, load_latest_iss_data, refresh_iss_cache, _CACHE, build_state_vector_arrays, build_epochs_serializer, prepare_iss_data, STATE_VECTOR_FIELDS, calculate_location, calculate_locations, _locate_bulk, get_geoposition, _geoposition_cached, GeoCache, db, app
 from flask.testing import FlaskClient
 import requests
+import responses
+import numpy as np
+from sqlalchemy import text
+import orjson
+import iss_tracker
+from conftest import build_oem_xml
 
 # Constants
 URL = "https://nasa-public-data.s3.amazonaws.com/iss-coords/current/ISS_OEM/ISS.OEM_J2K_EPH.xml"
@@ -56,6 +63,14 @@ mock_state_vectors = [
     }
 ]
 
+SMALL_VALID_XML = build_oem_xml(mock_state_vectors)
+
+# The mock state vectors as one structured array, in the same units and epoch type as the parsed data
+MOCK_ARR = np.array(
+    [(vector['EPOCH'].rstrip('Z'), *(vector[key] for key in STATE_VECTOR_FIELDS)) for vector in mock_state_vectors],
+    dtype=[('EPOCH', 'datetime64[us]')] + [(key, 'f8') for key in STATE_VECTOR_FIELDS]
+)
+
 def test_parse_date():
     """
     Tests the parse_date function to ensure it correctly processes the data.
@@ -71,12 +86,161 @@ def test_parse_date():
 
     assert parse_date(test_date_str) == expected_date
 
-    with pytest.raises(ValueError):
-        parse_date("Invalid-Date-String")
+    # Layouts outside the fast path fall back to strptime
+    assert parse_date("2024-366T23:59:59.5Z") == datetime(2024, 12, 31, 23, 59, 59, 500000)
+
+    for invalid_date_str in ["Invalid-Date-String", "2024-000T12:00:00.000Z", "2024-047T24:00:00.000Z", "2024-047T12:00:00,000Z"]:
+        with pytest.raises(ValueError):
+            parse_date(invalid_date_str)
+
+def test_parse_dates():
+    """
+    Tests the parse_dates function to ensure it parses a batch of dates like parse_date.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    test_date_strs = ["2024-047T12:00:00.000Z", "2024-060T23:59:59.123Z", "2023-365T00:04:00.000Z"]
+    parsed = parse_dates(test_date_strs)
+
+    assert parsed.dtype == np.dtype('datetime64[us]')
+    assert parsed.tolist() == [parse_date(date_str) for date_str in test_date_strs]
+
+    # Malformed layouts are rejected rather than parsed into shifted epochs
+    for invalid_date_str in ["Invalid-Date-String", "2024-000T12:00:00.000Z", "2024-367T12:00:00.000Z", "2024-047T12:00:00.000", "2024-047T12:00:00,000Z"]:
+        with pytest.raises(ValueError):
+            parse_dates(["2024-047T12:00:00.000Z", invalid_date_str])
+
+def test_isoformat_dates():
+    """
+    Tests the isoformat_dates function to ensure it formats dates the same way as datetime.isoformat.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    test_dates = [datetime(2024, 2, 16, 12, 0, 0), datetime(2024, 2, 29, 23, 59, 59, 123000)]
+
+    assert isoformat_dates(np.array(test_dates, dtype='datetime64[us]')) == [date.isoformat() for date in test_dates]
+
+@pytest.mark.parametrize("epoch,matches", [
+    ('2024-02-16T12:00:00', True),
+    ('2024-02-16T12:00:00.123456Z', True),
+    ('2024-02-16T14:00:00+02:00', True),
+    # Right shape but impossible dates are left to datetime.fromisoformat
+    ('2024-13-32T25:61:61', True),
+    ('invalid_epoch', False),
+    ('1.5', False),
+    ('-1', False),
+    ('abc', False),
+    ('2024-02-16', False),
+    ('2024-02-16T12:00:00abc', False),
+    ('2024-02-16T12:00:00' + '0' * 10000, False),
+    # A very long fraction still matches in linear time and is rejected later by parse_epoch
+    ('2024-02-16T12:00:00.' + '0' * 10000, True),
+])
+def test_epoch_pattern(epoch, matches):
+    """
+    Tests the EPOCH_PATTERN regex to ensure it only accepts strings shaped like ISO epochs.
+
+    Args:
+        epoch (str): Candidate epoch string.
+        matches (bool): Whether the pattern should accept it.
+
+    Returns:
+        None
+    """
+    assert (EPOCH_PATTERN.fullmatch(epoch) is not None) == matches
+
+def test_parse_epoch():
+    """
+    Tests the parse_epoch function to ensure it parses request epochs into naive UTC datetimes.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    assert parse_epoch('2024-02-16T12:00:00') == datetime(2024, 2, 16, 12, 0, 0)
+    assert parse_epoch('2024-02-16T14:00:00+02:00') == datetime(2024, 2, 16, 12, 0, 0)
+    assert parse_epoch('2024-02-16T12:00:00.000Z') == datetime(2024, 2, 16, 12, 0, 0)
+    assert parse_epoch('2024-02-16T12:00:00.123456') == datetime(2024, 2, 16, 12, 0, 0, 123456)
+
+    # Malformed strings, impossible dates and fractions finer than a microsecond are all rejected
+    for invalid_epoch in ['invalid_epoch', '2024-02-16', '2024-02-16T12:00:00abc', '2024-13-32T25:61:61', '2024-02-16T12:00:00.1234567']:
+        with pytest.raises(ValueError):
+            parse_epoch(invalid_epoch)
+
+def test_parse_iss_data():
+    """
+    Tests the parse_iss_data function to ensure it streams through a large document and keeps every state vector.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    start = datetime(2024, 2, 22, 12, 0, 0)
+    state_vectors = [
+        {'EPOCH': (start + timedelta(minutes=4 * i)).isoformat(), 'X': 4000.0 + i, 'Y': -231.4, 'Z': 1450.5, 'X_DOT': 0.67, 'Y_DOT': 2.08, 'Z_DOT': -0.03}
+        for i in range(10000)
+    ]
+    data = parse_iss_data(build_oem_xml(state_vectors))
+
+    assert data['header']['ORIGINATOR'] == 'JSC'
+    assert data['comments'] == ['Test comment']
+    assert data['state_vectors'] == state_vectors
 
+@responses.activate
 def test_download_and_parse_iss_data():
     """
-    Tests the download_and_parse_iss_data function to ensure it can download and parse data from the NASA website.
+    Tests the download_and_parse_iss_data function to ensure it parses a downloaded OEM document.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    responses.add(responses.GET, URL, body=SMALL_VALID_XML, status=200)
+    data = download_and_parse_iss_data(URL)
+
+    assert data['header'] == {'CREATION_DATE': '2024-053T12:00:00.000Z', 'ORIGINATOR': 'JSC'}
+    assert data['metadata']['OBJECT_NAME'] == 'ISS'
+    assert data['comments'] == ['Test comment']
+    parsed = np.array(
+        [tuple(vector[key] for key in MOCK_ARR.dtype.names) for vector in data['state_vectors']],
+        dtype=MOCK_ARR.dtype
+    )
+    assert np.array_equal(parsed, MOCK_ARR)
+
+@responses.activate
+def test_download_and_parse_iss_data_raises_error():
+    """
+    Tests the download_and_parse_iss_data function to ensure download failures are raised to the caller.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    responses.add(responses.GET, URL, body=requests.ConnectionError("Connection refused"))
+    with pytest.raises(requests.ConnectionError):
+        download_and_parse_iss_data(URL)
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_download_and_parse_iss_data_live():
+    """
+    Tests the download_and_parse_iss_data function to ensure it can download and parse the live data from the NASA website.
 
     Args:
         None
@@ -125,6 +289,13 @@ def test_download_and_parse_iss_data():
     epoch_str = example_vector['EPOCH']
     assert datetime.fromisoformat(epoch_str)
 
+    # Check every state vector at once: all fields present and finite
+    values = np.asarray([[vector[key] for key in STATE_VECTOR_FIELDS] for vector in state_vectors], dtype=np.float64)
+    assert values.shape == (len(state_vectors), len(STATE_VECTOR_FIELDS))
+    assert np.isfinite(values).all()
+
+@pytest.mark.slow
+@pytest.mark.integration
 def test_fetch_iss_data():
     """
     Tests the fetch_iss_data function to ensure it can retrieve data from the server or database.
@@ -151,6 +322,79 @@ def test_fetch_iss_data():
         assert all(isinstance(example_vector[key], float) for key in ['X', 'Y', 'Z', 'X_DOT', 'Y_DOT', 'Z_DOT'])
         assert isinstance(example_vector['EPOCH'], str)
 
+        # Check every state vector at once: all fields present and finite
+        values = np.asarray([[vector[key] for key in STATE_VECTOR_FIELDS] for vector in data['state_vectors']], dtype=np.float64)
+        assert values.shape == (len(data['state_vectors']), len(STATE_VECTOR_FIELDS))
+        assert np.isfinite(values).all()
+
+def test_load_latest_iss_data_with_legacy_table():
+    """
+    Tests the load_latest_iss_data function to ensure a database still holding the original `iss_data` table keeps working.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    with app.app_context():
+        db.session.execute(text("CREATE TABLE iss_data (id INTEGER NOT NULL PRIMARY KEY, data JSON NOT NULL, timestamp DATETIME NOT NULL)"))
+        db.session.execute(text("INSERT INTO iss_data (data, timestamp) VALUES ('{}', '2024-02-22 12:00:00')"))
+        db.session.commit()
+
+        try:
+            db.create_all()
+            latest_data, data = load_latest_iss_data()
+
+            assert latest_data.xml
+            assert len(data['state_vectors']) > 0
+        finally:
+            db.session.execute(text("DROP TABLE iss_data"))
+            db.session.commit()
+
+def test_refresh_iss_cache():
+    """
+    Tests the refresh_iss_cache function to ensure it loads current ISS data into the in-memory cache.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    refresh_iss_cache()
+
+    assert _CACHE['expires'] > datetime.utcnow()
+    assert len(_CACHE['data']['state_vectors']) > 0
+
+def test_fetch_iss_data_serves_stale_data(monkeypatch):
+    """
+    Tests the fetch_iss_data function to ensure it keeps serving the cached data when a reload fails.
+
+    Args:
+        monkeypatch (MonkeyPatch): pytest fixture used to make the reload fail.
+
+    Returns:
+        None
+    """
+    stale_data = {'state_vectors': []}
+    monkeypatch.setitem(_CACHE, 'data', stale_data)
+    monkeypatch.setitem(_CACHE, 'expires', datetime.min)
+
+    def failing_reload(max_age=None):
+        raise requests.ConnectionError("S3 down")
+    monkeypatch.setattr(iss_tracker, 'reload_iss_cache', failing_reload)
+
+    assert fetch_iss_data() is stale_data
+    # The next attempt is postponed instead of retried by every request
+    assert _CACHE['expires'] > datetime.utcnow()
+
+    # Without any data to fall back on the failure is raised
+    monkeypatch.setitem(_CACHE, 'data', None)
+    monkeypatch.setitem(_CACHE, 'expires', datetime.min)
+    with pytest.raises(requests.ConnectionError):
+        fetch_iss_data()
+
 def test_calculate_speed():
     """
     Tests the calculate_speed function to ensure it returns the correct value for speed.
@@ -165,43 +409,244 @@ def test_calculate_speed():
     expected_speed = 5.0
     assert calculate_speed(x_dot, y_dot, z_dot) == expected_speed
 
-def test_find_epoch_by_date():
+def test_calculate_speed_batch(iss_data):
+    """
+    Tests the calculate_speed_batch function to ensure it returns the magnitude of every velocity vector.
+
+    Args:
+        iss_data (dict): Session-wide ISS data.
+
+    Returns:
+        None
+    """
+    velocities = np.array([[vector['X_DOT'], vector['Y_DOT'], vector['Z_DOT']] for vector in iss_data['state_vectors']])
+    speeds = calculate_speed_batch(velocities)
+
+    assert speeds.shape == (len(iss_data['state_vectors']),)
+    assert speeds == pytest.approx(np.sqrt((velocities ** 2).sum(axis=1)))
+    assert calculate_speed_batch(np.array([[4.0, 3.0, 0.0]])).tolist() == [5.0]
+
+@pytest.mark.slow
+def test_calculate_speed_batch_reference(iss_data):
+    """
+    Tests the calculate_speed_batch function to ensure it matches calculate_speed for every state vector.
+
+    Args:
+        iss_data (dict): Session-wide ISS data.
+
+    Returns:
+        None
+    """
+    velocities = np.array([[vector['X_DOT'], vector['Y_DOT'], vector['Z_DOT']] for vector in iss_data['state_vectors']])
+    speeds = calculate_speed_batch(velocities)
+
+    assert speeds.tolist() == pytest.approx([calculate_speed(*velocity) for velocity in velocities.tolist()])
+
+def test_find_epoch_index_by_date(iss_data, valid_epoch):
+    """
+    Tests the find_epoch_index_by_date function to ensure it returns the index of a given date.
+
+    Args:
+        iss_data (dict): Session-wide ISS data.
+        valid_epoch (str): An epoch present in the ISS data.
+
+    Returns:
+        None
+    """
+    last_epoch = iss_data['state_vectors'][-1]['EPOCH']
+
+    assert find_epoch_index_by_date(iss_data, datetime.fromisoformat(valid_epoch)) == 0
+    assert find_epoch_index_by_date(iss_data, datetime.fromisoformat(last_epoch)) == len(iss_data['state_vectors']) - 1
+    assert find_epoch_index_by_date(iss_data, datetime.fromisoformat(valid_epoch).replace(tzinfo=timezone.utc)) == 0
+    assert find_epoch_index_by_date(iss_data, datetime.fromisoformat(valid_epoch) - timedelta(days=365)) is None
+
+def test_find_epoch_by_date(iss_data, valid_epoch):
     """
     Tests the find_epoch_by_date function to ensure it correctly finds and returns the data for a given date.
 
     Args:
+        iss_data (dict): Session-wide ISS data.
+        valid_epoch (str): An epoch present in the ISS data.
+
+    Returns:
         None
+    """
+    result = find_epoch_by_date(iss_data, datetime.fromisoformat(valid_epoch))
+
+    assert result is not None
+    assert result['EPOCH'] == valid_epoch
+
+    # Dates between epochs and dates outside the data set are not matched
+    assert find_epoch_by_date(iss_data, datetime.fromisoformat(valid_epoch) + timedelta(seconds=1)) is None
+    assert find_epoch_by_date(iss_data, datetime(2099, 1, 1)) is None
+
+    # Any sample of epochs resolves to its own state vector through the index
+    for vector in random.Random(0).sample(iss_data['state_vectors'], min(100, len(iss_data['state_vectors']))):
+        assert find_epoch_by_date(iss_data, datetime.fromisoformat(vector['EPOCH'])) is vector
+
+def test_find_closest_epoch_index(iss_data):
+    """
+    Tests the find_closest_epoch_index function to ensure it returns the state vector nearest to a given date.
+
+    Args:
+        iss_data (dict): Session-wide ISS data.
 
     Returns:
         None
     """
-    with app.app_context():
-        data = fetch_iss_data()
-        valid_epoch = data['state_vectors'][0]['EPOCH']
-        result = find_epoch_by_date(data['state_vectors'], valid_epoch)
+    epochs = [datetime.fromisoformat(vector['EPOCH']) for vector in iss_data['state_vectors']]
+
+    assert find_closest_epoch_index(iss_data, epochs[1]) == 1
+    assert find_closest_epoch_index(iss_data, epochs[1] + timedelta(seconds=1)) == 1
+    assert find_closest_epoch_index(iss_data, epochs[0] - timedelta(days=365)) == 0
+    assert find_closest_epoch_index(iss_data, epochs[-1] + timedelta(days=365)) == len(epochs) - 1
+
+    # The binary search relies on ascending epochs and agrees with a full scan for any date in range
+    epoch_array = iss_data['_arrays']['EPOCH']
+    assert np.all(np.diff(epoch_array) > np.timedelta64(0))
+    rng = np.random.default_rng(0)
+    span = (epoch_array[-1] - epoch_array[0]).astype(np.int64)
+    for offset in rng.integers(0, span, size=1000, endpoint=True):
+        date = (epoch_array[0] + np.timedelta64(int(offset), 'us')).item()
+        assert find_closest_epoch_index(iss_data, date) == int(np.argmin(np.abs(epoch_array - np.datetime64(date, 'us'))))
+
+def test_build_state_vector_arrays():
+    """
+    Tests the build_state_vector_arrays function to ensure it converts the state vectors into per-field arrays.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    state_vectors = [dict(vector, EPOCH=vector['EPOCH'].rstrip('Z')) for vector in mock_state_vectors]
+    arrays = build_state_vector_arrays(state_vectors)
+
+    assert arrays['EPOCH'].dtype == np.dtype('datetime64[us]')
+    assert np.array_equal(arrays['EPOCH'], MOCK_ARR['EPOCH'])
+    for key in STATE_VECTOR_FIELDS:
+        assert arrays[key].dtype == np.float64
+        assert np.array_equal(arrays[key], MOCK_ARR[key])
+
+def test_build_epochs_serializer():
+    """
+    Tests the build_epochs_serializer function to ensure it encodes pages of state vectors and reuses only the full data set.
 
-        assert result is not None
-        assert result['EPOCH'] == valid_epoch
+    Args:
+        None
 
-def test_calculate_location():
+    Returns:
+        None
+    """
+    serialize_epochs = build_epochs_serializer(mock_state_vectors)
+
+    assert orjson.loads(serialize_epochs(1, 2)) == mock_state_vectors[1:3]
+    assert orjson.loads(serialize_epochs(0, None)) == mock_state_vectors
+    # Only the full data set is cached, however the client spells its page
+    assert serialize_epochs(0, None) is serialize_epochs(0, len(mock_state_vectors))
+    assert serialize_epochs(0, None) is serialize_epochs(0, 10 ** 9)
+    assert orjson.loads(serialize_epochs(1, 10 ** 9)) == mock_state_vectors[1:]
+    assert serialize_epochs(1, 2) is not serialize_epochs(1, 2)
+
+def test_prepare_iss_data():
+    """
+    Tests the prepare_iss_data function to ensure it adds the derived lookup structures without modifying the input.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    iss_data = {
+        'header': {'CREATION_DATE': '2024-053T12:00:00.000Z', 'ORIGINATOR': 'JSC'},
+        'metadata': {'OBJECT_NAME': 'ISS'},
+        'comments': ['Test comment'],
+        'state_vectors': [dict(vector, EPOCH=vector['EPOCH'].rstrip('Z')) for vector in mock_state_vectors] + [
+            # Full precision values as published in the NASA OEM
+            {'EPOCH': '2024-02-22T17:00:00', 'X': -4235.7059365386898, 'Y': 3862.3916214576938, 'Z': 3752.6473347109985,
+             'X_DOT': -3.2397225171608, 'Y_DOT': -6.1914833383286, 'Z_DOT': 2.7494514493889}
+        ]
+    }
+    prepared = prepare_iss_data(iss_data)
+
+    assert set(iss_data) == {'header', 'metadata', 'comments', 'state_vectors'}
+    assert prepared['_epoch_index'][datetime(2024, 2, 22, 13, 0, 0)] == 1
+
+    # The derived columns are computed from the full precision values, and the position/velocity columns are not kept
+    arrays = prepared['_arrays']
+    assert set(arrays) == {'EPOCH', 'SPEED', 'LATITUDE', 'LONGITUDE', 'ALTITUDE'}
+    for i, vector in enumerate(iss_data['state_vectors']):
+        lat, lon, alt = calculate_location(vector, datetime.fromisoformat(vector['EPOCH']))
+        assert arrays['SPEED'][i] == pytest.approx(calculate_speed(vector['X_DOT'], vector['Y_DOT'], vector['Z_DOT']), abs=1e-12)
+        assert arrays['LATITUDE'][i] == pytest.approx(lat, abs=1e-9)
+        assert arrays['LONGITUDE'][i] == pytest.approx(lon, abs=1e-9)
+        assert arrays['ALTITUDE'][i] == pytest.approx(alt, abs=1e-9)
+    assert orjson.loads(prepared['_comment_json']) == iss_data['comments']
+    assert orjson.loads(prepared['_header_json']) == iss_data['header']
+    assert orjson.loads(prepared['_metadata_json']) == iss_data['metadata']
+
+def test_calculate_location(first_vector):
     """
     Tests the calculate_location function to ensure it calculates the latitude, longitude, and altitude.
     
+    Args:
+        first_vector (dict): The first state vector of the ISS data.
+
+    Returns:
+        None
+    """
+    lat, lon, alt = calculate_location(first_vector, datetime.fromisoformat(first_vector['EPOCH']))
+    assert isinstance(lat, float)
+    assert isinstance(lon, float)
+    assert isinstance(alt, float)
+
+def test_calculate_locations():
+    """
+    Tests the calculate_locations function to ensure it matches calculate_location for every state vector.
+
     Args:
         None
 
     Returns:
         None
     """
-    with app.app_context():
-        data = fetch_iss_data()
-        test_epoch_data = data['state_vectors'][0]
+    state_vectors = [dict(vector, EPOCH=vector['EPOCH'].rstrip('Z')) for vector in mock_state_vectors]
+    lats, lons, alts = calculate_locations(build_state_vector_arrays(state_vectors))
 
-        lat, lon, alt = calculate_location(test_epoch_data)
-        assert isinstance(lat, float)
-        assert isinstance(lon, float)
-        assert isinstance(alt, float)
+    for i, vector in enumerate(state_vectors):
+        lat, lon, alt = calculate_location(vector, datetime.fromisoformat(vector['EPOCH']))
+        assert lats[i] == pytest.approx(lat)
+        assert lons[i] == pytest.approx(lon)
+        assert alts[i] == pytest.approx(alt)
+
+def test_locate_bulk(iss_data):
+    """
+    Tests the _locate_bulk kernel to ensure it agrees with calculate_location for every state vector given float64 inputs.
 
+    Args:
+        iss_data (dict): Session-wide ISS data.
+
+    Returns:
+        None
+    """
+    state_vectors = iss_data['state_vectors']
+    x, y, z = (np.array([vector[key] for vector in state_vectors]) for key in ('X', 'Y', 'Z'))
+    epochs = [datetime.fromisoformat(vector['EPOCH']) for vector in state_vectors]
+    hrs = np.array([epoch.hour for epoch in epochs])
+    mins = np.array([epoch.minute for epoch in epochs])
+
+    lats, lons, alts = _locate_bulk(x, y, z, hrs, mins)
+
+    for i, (vector, epoch) in enumerate(zip(state_vectors, epochs)):
+        lat, lon, alt = calculate_location(vector, epoch)
+        assert lats[i] == pytest.approx(lat, abs=1e-9)
+        assert lons[i] == pytest.approx(lon, abs=1e-9)
+        assert alts[i] == pytest.approx(alt, abs=1e-9)
+
+@pytest.mark.slow
+@pytest.mark.integration
 def test_get_geoposition():
     """
     Tests the get_geoposition function to ensure it retrieves the correct geolocation information.
@@ -220,11 +665,62 @@ def test_get_geoposition():
         assert isinstance(location_info, str)
         assert "New York" in location_info
 
-@pytest.fixture
-def client():
-    app.config['TESTING'] = True
-    with app.test_client() as client:
-        yield client
+def test_get_geoposition_memory_cache(monkeypatch):
+    """
+    Tests the get_geoposition function to ensure repeated and nearby coordinates are served from the in-memory cache.
+
+    Args:
+        monkeypatch (MonkeyPatch): pytest fixture used to stub the geocoder.
+
+    Returns:
+        None
+    """
+    calls = []
+
+    def reverse(coordinates, language=None):
+        calls.append(coordinates)
+        return type('Location', (), {'address': "Stub address"})()
+    monkeypatch.setattr(iss_tracker.GEOLOCATOR, 'reverse', reverse)
+
+    with app.app_context():
+        _geoposition_cached.cache_clear()
+
+        try:
+            assert get_geoposition(-45.6123, 170.5234) == "Stub address"
+            assert get_geoposition(-45.6123, 170.5234) == "Stub address"
+            # Coordinates within the same cell share the cached address
+            assert get_geoposition(-45.6401, 170.4799) == "Stub address"
+
+            assert calls == [(-45.6, 170.5)]
+            assert _geoposition_cached.cache_info().hits == 2
+        finally:
+            cached_address = db.session.get(GeoCache, (-45.6, 170.5))
+            if cached_address:
+                db.session.delete(cached_address)
+                db.session.commit()
+            _geoposition_cached.cache_clear()
+
+def test_get_geoposition_database_cache():
+    """
+    Tests the get_geoposition function to ensure it reuses addresses stored in the database without calling the geocoder.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    with app.app_context():
+        db.session.merge(GeoCache(lat=12.3, lon=56.8, address="Cached address"))
+        db.session.commit()
+        _geoposition_cached.cache_clear()
+
+        try:
+            assert get_geoposition(12.3401, 56.7799) == "Cached address"
+        finally:
+            db.session.delete(db.session.get(GeoCache, (12.3, 56.8)))
+            db.session.commit()
+            _geoposition_cached.cache_clear()
 
 def test_get_comment(client):
     """
@@ -265,79 +761,130 @@ def test_get_metadata(client):
     response = client.get('/metadata')
     assert response.status_code == 200
 
-def test_get_epochs_data(client):
+@pytest.mark.parametrize("param,status_code", [
+    ('?limit=0', 400),
+    ('?limit=-10', 400),
+    ('?offset=-5', 400),
+    ('?offset=9999999999999999999', 400),
+    ('?limit=abc', 400),
+    ('?offset=def', 400),
+    ('?limit=0.5', 400),
+    ('?offset=1.5', 400),
+])
+def test_get_epochs_invalid_params(client, param, status_code):
     """
-    Tests the /epochs route with & without query parameters to ensure it returns the correct list of epochs.
+    Tests the /epochs route to ensure it rejects invalid limit and offset query parameters.
 
     Args:
         client (FlaskClient): Flask test client.
+        param (str): Query string appended to the route.
+        status_code (int): Expected HTTP status code.
 
     Returns:
         None
     """
-    # Test no query parameters
-    response = client.get('/epochs')
+    response = client.get(f'/epochs{param}')
+    assert response.status_code == status_code
+
+@pytest.mark.parametrize("param,status_code", [
+    ('', 200),
+    ('?limit=10', 200),
+    ('?offset=5', 200),
+    ('?limit=9999999999999999999', 200),
+    ('?offset=0', 200),
+])
+def test_get_epochs_valid_params(client, param, status_code):
+    """
+    Tests the /epochs route with & without query parameters to ensure it returns the list of epochs.
+
+    Args:
+        client (FlaskClient): Flask test client.
+        param (str): Query string appended to the route.
+        status_code (int): Expected HTTP status code.
+
+    Returns:
+        None
+    """
+    response = client.get(f'/epochs{param}')
+    assert response.status_code == status_code
+
+def test_get_epochs_data_with_query(client, iss_data):
+    """
+    Tests the /epochs route to ensure limit and offset select the matching page of state vectors.
+
+    Args:
+        client (FlaskClient): Flask test client.
+        iss_data (dict): Session-wide ISS data.
+
+    Returns:
+        None
+    """
+    response = client.get('/epochs?limit=3&offset=2')
     assert response.status_code == 200
+    assert response.get_json() == iss_data['state_vectors'][2:5]
 
-    # Test invalid limit and offset
-    invalid_params = [
-        ('?limit=0', 400),
-        ('?limit=-10', 400),
-        ('?offset=-5', 400),
-        ('?offset=9999999999999999999', 400),
-        ('?limit=abc', 400),
-        ('?offset=def', 400),
-        ('?limit=0.5', 400),
-        ('?offset=1.5', 400),
-    ]
-    valid_params = [
-        ('?limit=10', 200),
-        ('?offset=5', 200),
-        ('?limit=9999999999999999999', 200),
-        ('?offset=0', 200)
-    ]
-    for param, status_code in invalid_params:
-        response = client.get(f'/epochs{param}')
-        assert response.status_code == status_code
+    response = client.get('/epochs')
+    assert len(response.get_json()) == len(iss_data['state_vectors'])
+
+    # Without a limit every state vector is returned whatever the offset
+    response = client.get('/epochs?offset=2')
+    assert len(response.get_json()) == len(iss_data['state_vectors'])
 
-    for param, status_code in valid_params:
-        response = client.get(f'/epochs{param}')
-        assert response.status_code == status_code
+    # Limits past the end of the data set are clamped to it
+    response = client.get('/epochs?limit=100000&offset=2')
+    assert response.get_json() == iss_data['state_vectors'][2:]
 
-def test_get_specific_epoch_data(client):
+def test_get_specific_epoch_data(client, valid_epoch):
     """
     Tests the /epochs/<epoch> route to ensure it returns data for a specific epoch.
 
     Args:
         client (FlaskClient): Flask test client.
+        valid_epoch (str): An epoch present in the ISS data.
 
     Returns:
         None
     """
-    # Test valid epoch
-    with app.app_context():
-        data = fetch_iss_data()
-        valid_epoch = data['state_vectors'][0]['EPOCH']
     response = client.get(f'/epochs/{valid_epoch}')
     assert response.status_code == 200
     data = response.get_json()
     assert 'EPOCH' in data
     assert data['EPOCH'] == valid_epoch
 
-    # Test invalid epochs
-    invalid_epochs = [
-        'invalid_epoch',
-        '2024-13-32T25:61:61',
-        '2024-00-00T00:00:00',
-        '2023-02-29T00:00:00',
-        '1.5',
-        '-1',
-        'abc'
-    ]
-    for epoch in invalid_epochs:
-        response = client.get(f'/epochs/{epoch}')
-        assert response.status_code == 400
+@pytest.mark.parametrize("epoch", [
+    'invalid_epoch',
+    '2024-13-32T25:61:61',
+    '2024-00-00T00:00:00',
+    '2023-02-29T00:00:00',
+    '1.5',
+    '-1',
+    'abc',
+    '2024-02-16T12:00:00.' + '0' * 10000
+])
+def test_get_specific_epoch_invalid(client, epoch):
+    """
+    Tests the /epochs/<epoch> route to ensure it rejects malformed or impossible epochs.
 
+    Args:
+        client (FlaskClient): Flask test client.
+        epoch (str): Invalid epoch string.
+
+    Returns:
+        None
+    """
+    response = client.get(f'/epochs/{epoch}')
+    assert response.status_code == 400
+
+def test_get_specific_epoch_not_found(client):
+    """
+    Tests the /epochs/<epoch> route to ensure it returns 404 for empty and unknown epochs.
+
+    Args:
+        client (FlaskClient): Flask test client.
+
+    Returns:
+        None
+    """
     # Test empty epoch
     response = client.get('/epochs/')
     assert response.status_code == 404
@@ -350,36 +897,32 @@ def test_get_specific_epoch_data(client):
     assert 'error' in data
     assert data['error'] == 'Epoch not found'
 
-def test_get_specific_epoch_speed(client):
+def test_get_specific_epoch_speed(client, valid_epoch):
     """
     Tests the /epochs/<epoch>/speed route to ensure it returns the speed.
 
     Args:
         client (FlaskClient): Flask test client.
+        valid_epoch (str): An epoch present in the ISS data.
 
     Returns:
         None
     """
-    with app.app_context():
-        data = fetch_iss_data()
-        valid_epoch = data['state_vectors'][0]['EPOCH']
     response = client.get(f'/epochs/{valid_epoch}/speed')
     assert response.status_code == 200
     assert 'SPEED' in response.json
 
-def test_get_specific_epoch_location(client):
+def test_get_specific_epoch_location(client, valid_epoch):
     """
     Tests the /epochs/<epoch>/location route to ensure it returns the latitude, longitude, altitude, and geolocation.
 
     Args:
         client (FlaskClient): Flask test client.
+        valid_epoch (str): An epoch present in the ISS data.
 
     Returns:
         None
     """
-    with app.app_context():
-        data = fetch_iss_data()
-        valid_epoch = data['state_vectors'][0]['EPOCH']
     response = client.get(f'/epochs/{valid_epoch}/location')
     assert response.status_code == 200
     assert 'LATITUDE' in response.json